@@ -10,10 +10,40 @@ from .kinematics import *
 from . import utils
 from .utils import *
 
-__all__ = ["vector", "pose", "kinematics", "utils"]
+from . import simulation
+from .simulation import *
+
+from . import buffer
+from .buffer import *
+
+from . import path
+from .path import *
+
+from . import cache
+from .cache import *
+
+from . import particles
+from .particles import *
+
+__all__ = [
+    "vector",
+    "pose",
+    "kinematics",
+    "utils",
+    "simulation",
+    "buffer",
+    "path",
+    "cache",
+    "particles",
+]
 __all__.extend(vector.__all__)
 __all__.extend(pose.__all__)
 __all__.extend(kinematics.__all__)
 __all__.extend(utils.__all__)
+__all__.extend(simulation.__all__)
+__all__.extend(buffer.__all__)
+__all__.extend(path.__all__)
+__all__.extend(cache.__all__)
+__all__.extend(particles.__all__)
 
 name = "kinematics2d"
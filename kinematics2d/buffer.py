@@ -0,0 +1,190 @@
+import typing
+
+import numpy as np
+
+import kinematics2d as k2d
+
+__all__ = ["KinematicsFrame", "KinematicsBuffer"]
+
+
+def _frozen(array: np.ndarray) -> np.ndarray:
+    array.flags.writeable = False
+    return array
+
+
+class KinematicsFrame:
+    """An immutable snapshot of a batch of 2-dimensional kinematics.
+
+    The states are stored as read-only arrays, row i belonging to keys[i].
+
+    Attributes:
+        - sequence: int (number of the publish that produced this frame)
+        - keys: tuple
+        - positions: np.ndarray (N x 2)
+        - orientations: np.ndarray (N, in radians)
+        - velocities: np.ndarray (N x 2)
+        - rotations: np.ndarray (N, in radians)
+    """
+
+    def __init__(
+        self,
+        sequence: int,
+        keys: typing.Tuple[typing.Hashable, ...],
+        indices: typing.Dict[typing.Hashable, int],
+        positions: np.ndarray,
+        orientations: np.ndarray,
+        velocities: np.ndarray,
+        rotations: np.ndarray,
+    ) -> None:
+        self._sequence: int = sequence
+        self._keys: typing.Tuple[typing.Hashable, ...] = keys
+        self._indices: typing.Dict[typing.Hashable, int] = indices
+        self._positions: np.ndarray = _frozen(positions)
+        self._orientations: np.ndarray = _frozen(orientations)
+        self._velocities: np.ndarray = _frozen(velocities)
+        self._rotations: np.ndarray = _frozen(rotations)
+
+    @property
+    def sequence(self) -> int:
+        return self._sequence
+
+    @property
+    def keys(self) -> typing.Tuple[typing.Hashable, ...]:
+        return self._keys
+
+    @property
+    def positions(self) -> np.ndarray:
+        return self._positions
+
+    @property
+    def orientations(self) -> np.ndarray:
+        return self._orientations
+
+    @property
+    def velocities(self) -> np.ndarray:
+        return self._velocities
+
+    @property
+    def rotations(self) -> np.ndarray:
+        return self._rotations
+
+    def __repr__(self) -> str:
+        return "KinematicsFrame(seq: {}, size: {})".format(
+            self._sequence, len(self._keys)
+        )
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: typing.Hashable) -> bool:
+        return key in self._indices
+
+    def index(self, key: typing.Hashable) -> int:
+        return self._indices[key]
+
+    def __getitem__(self, key: typing.Hashable) -> k2d.Kinematics:
+        """Build a new Kinematics from the state of key in this frame."""
+        i = self._indices[key]
+        return k2d.Kinematics(
+            k2d.Vector.from_ndarray(self._positions[i]),
+            float(self._orientations[i]),
+            k2d.Vector.from_ndarray(self._velocities[i]),
+            float(self._rotations[i]),
+        )
+
+    def pose(self, key: typing.Hashable) -> k2d.Pose:
+        i = self._indices[key]
+        return k2d.Pose(
+            k2d.Vector.from_ndarray(self._positions[i]), float(self._orientations[i])
+        )
+
+
+class KinematicsBuffer:
+    """A copy-on-publish container of a batch of kinematics for one writer.
+
+    The writer stages states into a private back buffer with set, then calls
+    publish to copy it into a new KinematicsFrame and swap the front frame
+    reference, so every publish allocates O(N) new arrays. Readers on any
+    thread get the front frame without locking; a frame is never modified after
+    it is published, so a reader holding it always sees a consistent state,
+    even while the writer publishes newer ones.
+    """
+
+    def __init__(
+        self,
+        keys: typing.Sequence[typing.Hashable],
+        initial: typing.Optional[
+            typing.Mapping[typing.Hashable, k2d.Kinematics]
+        ] = None,
+    ) -> None:
+        self._keys: typing.Tuple[typing.Hashable, ...] = tuple(keys)
+        self._indices: typing.Dict[typing.Hashable, int] = {
+            key: i for i, key in enumerate(self._keys)
+        }
+        if len(self._indices) != len(self._keys):
+            raise ValueError("keys must be unique")
+        size = len(self._keys)
+        self._positions: np.ndarray = np.zeros((size, 2))
+        self._orientations: np.ndarray = np.zeros(size)
+        self._velocities: np.ndarray = np.zeros((size, 2))
+        self._rotations: np.ndarray = np.zeros(size)
+        self._sequence: int = 0
+        if initial is not None:
+            for key, kinematics in initial.items():
+                self.set(key, kinematics)
+        self._front: KinematicsFrame = self._freeze()
+
+    @property
+    def keys(self) -> typing.Tuple[typing.Hashable, ...]:
+        return self._keys
+
+    @property
+    def frame(self) -> KinematicsFrame:
+        """The most recently published frame."""
+        return self._front
+
+    @property
+    def sequence(self) -> int:
+        return self._front.sequence
+
+    def __repr__(self) -> str:
+        return "KinematicsBuffer(seq: {}, size: {})".format(
+            self._front.sequence, len(self._keys)
+        )
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def set(self, key: typing.Hashable, kinematics: k2d.Kinematics) -> None:
+        """Stage the state of key in the back buffer (writer only)."""
+        i = self._indices[key]
+        self._positions[i, 0] = kinematics.position.x
+        self._positions[i, 1] = kinematics.position.y
+        self._orientations[i] = kinematics.orientation
+        self._velocities[i, 0] = kinematics.velocity.x
+        self._velocities[i, 1] = kinematics.velocity.y
+        self._rotations[i] = kinematics.rotation
+
+    def publish(
+        self,
+        bodies: typing.Optional[typing.Mapping[typing.Hashable, k2d.Kinematics]] = None,
+    ) -> KinematicsFrame:
+        """Stage bodies if given, then make the back buffer the new front frame."""
+        if bodies is not None:
+            for key, kinematics in bodies.items():
+                self.set(key, kinematics)
+        self._sequence += 1
+        frame = self._freeze()
+        self._front = frame
+        return frame
+
+    def _freeze(self) -> KinematicsFrame:
+        return KinematicsFrame(
+            self._sequence,
+            self._keys,
+            self._indices,
+            self._positions.copy(),
+            self._orientations.copy(),
+            self._velocities.copy(),
+            self._rotations.copy(),
+        )
@@ -0,0 +1,115 @@
+import collections
+import typing
+
+import kinematics2d as k2d
+
+__all__ = ["RelativeFrameCache"]
+
+
+_Frame = typing.TypeVar("_Frame", k2d.Pose, k2d.Kinematics)
+
+
+class RelativeFrameCache:
+    """A bounded LRU cache of relative poses and kinematics.
+
+    relative(target, origin) returns target - origin, computing it only when
+    the pair has not been seen since either object was last mutated. Entries
+    are keyed by the identity of the pair and hold the versions they were
+    computed at, so a mutated pair replaces its own entry. The least recently
+    used entry is evicted once max_size is reached. Results are shared between
+    callers, so a result that gets mutated is discarded and computed again on
+    its next use.
+
+    Attributes:
+        - max_size: int
+        - hits: int
+        - misses: int
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self._max_size: int = max_size
+        self._entries: "collections.OrderedDict[tuple, tuple]" = (
+            collections.OrderedDict()
+        )
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+    def __repr__(self) -> str:
+        return "RelativeFrameCache(size: {}/{}, hits: {}, misses: {})".format(
+            len(self._entries), self._max_size, self.hits, self.misses
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop every entry, e.g. at the start of a new control cycle."""
+        self._entries.clear()
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    def relative(self, target: _Frame, origin: _Frame) -> _Frame:
+        """Calculate target - origin, i.e. target in the coordinate frame of origin.
+
+        target and origin must be of the same type, either Pose or Kinematics.
+        """
+        key = (id(target), id(origin))
+        target_version = target.version
+        origin_version = origin.version
+        entry = self._entries.get(key)
+        if entry is not None:
+            # The references guard against ids reused by new objects.
+            (
+                cached_target,
+                cached_origin,
+                cached_target_version,
+                cached_origin_version,
+                result,
+                result_version,
+            ) = entry
+            if (
+                cached_target is target
+                and cached_origin is origin
+                and cached_target_version == target_version
+                and cached_origin_version == origin_version
+                and result.version == result_version
+            ):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+
+        self.misses += 1
+        result = target - origin
+        self._entries[key] = (
+            target,
+            origin,
+            target_version,
+            origin_version,
+            result,
+            result.version,
+        )
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+        return result
+
+    def relative_pose(self, target: k2d.Pose, origin: k2d.Pose) -> k2d.Pose:
+        return self.relative(target, origin)
+
+    def relative_kinematics(
+        self, target: k2d.Kinematics, origin: k2d.Kinematics
+    ) -> k2d.Kinematics:
+        return self.relative(target, origin)
@@ -27,6 +27,7 @@ class Kinematics:
         self._orientation: float = orientation
         self._velocity: k2d.Vector = k2d.Vector.from_copy(velocity)
         self._rotation: float = rotation
+        self._version: int = 0
 
     @classmethod
     def from_pose(
@@ -56,6 +57,7 @@ class Kinematics:
         self._position.x = value.position.x
         self._position.y = value.position.y
         self._orientation = value.orientation
+        self._version += 1
 
     @property
     def position(self) -> k2d.Vector:
@@ -65,6 +67,7 @@ class Kinematics:
     def position(self, value: k2d.Vector) -> None:
         self._position.x = value.x
         self._position.y = value.y
+        self._version += 1
 
     @property
     def orientation(self) -> float:
@@ -73,6 +76,7 @@ class Kinematics:
     @orientation.setter
     def orientation(self, value: float) -> None:
         self._orientation = value
+        self._version += 1
 
     @property
     def velocity(self) -> k2d.Vector:
@@ -82,6 +86,7 @@ class Kinematics:
     def velocity(self, value: k2d.Vector) -> None:
         self._velocity.x = value.x
         self._velocity.y = value.y
+        self._version += 1
 
     @property
     def rotation(self) -> float:
@@ -90,6 +95,12 @@ class Kinematics:
     @rotation.setter
     def rotation(self, value: float) -> None:
         self._rotation = value
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        """Counter that increases every time the kinematics is mutated."""
+        return self._version + self._position.version + self._velocity.version
 
     def __repr__(self) -> str:
         return "Kinematics(pos: {}, ort: {}, vel: {}, rot: {})".format(
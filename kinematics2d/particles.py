@@ -0,0 +1,164 @@
+import typing
+
+import numpy as np
+
+import kinematics2d as k2d
+
+__all__ = ["ParticleSet"]
+
+
+_ArrayLike = typing.Union[
+    typing.Sequence[float], typing.Sequence[typing.Sequence[float]], np.ndarray
+]
+
+
+class ParticleSet:
+    """A batch of 2-dimensional kinematics particles stored as arrays.
+
+    Particle i is made of row i of every array. propagate applies the motion
+    model of Kinematics.updated to all of them at once.
+
+    Attributes:
+        - positions: np.ndarray (M x 2)
+        - orientations: np.ndarray (M, in radians)
+        - velocities: np.ndarray (M x 2)
+        - rotations: np.ndarray (M, in radians)
+    """
+
+    def __init__(
+        self,
+        positions: _ArrayLike,
+        orientations: _ArrayLike,
+        velocities: _ArrayLike,
+        rotations: _ArrayLike,
+    ) -> None:
+        self.positions: np.ndarray = np.array(positions, dtype=float).reshape(-1, 2)
+        size = len(self.positions)
+        self.orientations: np.ndarray = np.array(orientations, dtype=float).reshape(
+            size
+        )
+        self.velocities: np.ndarray = np.array(velocities, dtype=float).reshape(
+            size, 2
+        )
+        self.rotations: np.ndarray = np.array(rotations, dtype=float).reshape(size)
+
+    @classmethod
+    def sample(
+        cls,
+        mean: k2d.Kinematics,
+        num_particles: int,
+        velocity_covariance: typing.Optional[np.ndarray] = None,
+        rotation_variance: float = 0.0,
+        position_covariance: typing.Optional[np.ndarray] = None,
+        orientation_variance: float = 0.0,
+        seed: typing.Optional[typing.Union[int, np.random.Generator]] = None,
+    ) -> "ParticleSet":
+        """Draw particles from a Gaussian around mean.
+
+        Covariances left as None are taken as zero. The same seed always draws
+        the same particles.
+        """
+        if num_particles < 1:
+            raise ValueError("num_particles must be at least 1")
+        if rotation_variance < 0.0 or orientation_variance < 0.0:
+            raise ValueError("variances must not be negative")
+        rng = np.random.default_rng(seed)
+
+        def gaussian(center: np.ndarray, covariance: typing.Optional[np.ndarray]):
+            if covariance is None:
+                return np.tile(center, (num_particles, 1))
+            return rng.multivariate_normal(center, covariance, num_particles)
+
+        def scalar(center: float, variance: float) -> np.ndarray:
+            return center + np.sqrt(variance) * rng.standard_normal(num_particles)
+
+        position = np.array([mean.position.x, mean.position.y])
+        velocity = np.array([mean.velocity.x, mean.velocity.y])
+        return cls(
+            gaussian(position, position_covariance),
+            scalar(mean.orientation, orientation_variance),
+            gaussian(velocity, velocity_covariance),
+            scalar(mean.rotation, rotation_variance),
+        )
+
+    @classmethod
+    def from_copy(cls, source: "ParticleSet") -> "ParticleSet":
+        return cls(
+            source.positions, source.orientations, source.velocities, source.rotations
+        )
+
+    def __repr__(self) -> str:
+        return "ParticleSet(size: {})".format(len(self))
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def __getitem__(self, index: int) -> k2d.Kinematics:
+        return k2d.Kinematics(
+            k2d.Vector.from_ndarray(self.positions[index]),
+            float(self.orientations[index]),
+            k2d.Vector.from_ndarray(self.velocities[index]),
+            float(self.rotations[index]),
+        )
+
+    def propagate(self, delta_time: float) -> None:
+        """Advance every particle in place, as Kinematics.updated does."""
+        delta_orientations = self.rotations * delta_time
+        cos = np.cos(delta_orientations)
+        sin = np.sin(delta_orientations)
+        delta_x = self.velocities[:, 0] * delta_time
+        delta_y = self.velocities[:, 1] * delta_time
+        self.positions[:, 0] += cos * delta_x - sin * delta_y
+        self.positions[:, 1] += sin * delta_x + cos * delta_y
+        self.orientations += delta_orientations
+
+    def propagated(self, delta_time: float) -> "ParticleSet":
+        particles = ParticleSet.from_copy(self)
+        particles.propagate(delta_time)
+        return particles
+
+    def mean_orientation(self) -> float:
+        """Calculate the circular mean of the orientations (between -PI and PI)."""
+        sin = np.sin(self.orientations).mean()
+        cos = np.cos(self.orientations).mean()
+        return float(np.arctan2(sin, cos))
+
+    def mean_pose(self) -> k2d.Pose:
+        return k2d.Pose(
+            k2d.Vector.from_ndarray(self.positions.mean(axis=0)),
+            self.mean_orientation(),
+        )
+
+    def covariance(self) -> np.ndarray:
+        """Calculate the 3 x 3 covariance of (x, y, orientation).
+
+        Orientations are taken relative to their circular mean, wrapped to
+        between -PI and PI.
+        """
+        residuals = self.orientations - self.mean_orientation()
+        orientations = (residuals + k2d.PI) % (2.0 * k2d.PI) - k2d.PI
+        samples = np.column_stack((self.positions, orientations))
+        if len(samples) < 2:
+            return np.zeros((3, 3))
+        return np.cov(samples, rowvar=False)
+
+    def histogram(
+        self,
+        bins: typing.Union[int, typing.Sequence[int]] = 10,
+        bounds: typing.Optional[typing.Sequence[typing.Sequence[float]]] = None,
+        normalized: bool = True,
+    ) -> typing.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Count the particle positions on an x/y grid.
+
+        bounds is [[x_min, x_max], [y_min, y_max]]. Returns the occupancy grid
+        (indexed by x bin, then y bin) and the x and y bin edges, as
+        np.histogram2d does. A normalized grid holds the fraction of all
+        particles in each cell, so it sums to less than 1 when bounds leave
+        some particles out.
+        """
+        grid, x_edges, y_edges = np.histogram2d(
+            self.positions[:, 0], self.positions[:, 1], bins=bins, range=bounds
+        )
+        if normalized:
+            grid /= len(self)
+        return grid, x_edges, y_edges
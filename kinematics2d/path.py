@@ -0,0 +1,228 @@
+import typing
+
+import numpy as np
+
+import kinematics2d as k2d
+
+__all__ = ["Path"]
+
+
+_ArrayLike = typing.Union[float, typing.Sequence[float], np.ndarray]
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+class Path:
+    """A 2-dimensional polyline path.
+
+    Segment i goes from waypoint i to waypoint i + 1, and consecutive waypoints
+    must differ. Query methods accept arrays and are evaluated for every
+    element at once.
+
+    Attributes:
+        - waypoints: np.ndarray (N x 2, read-only)
+        - arc_lengths: np.ndarray (N, arc length at each waypoint)
+        - segment_lengths: np.ndarray (N - 1)
+        - segment_directions: np.ndarray (N - 1 x 2, unit vectors)
+        - length: float
+    """
+
+    def __init__(self, waypoints: np.ndarray) -> None:
+        waypoints = np.array(waypoints, dtype=float)
+        if waypoints.ndim != 2 or waypoints.shape[1] != 2:
+            raise ValueError("waypoints must be an N x 2 array")
+        if waypoints.shape[0] < 2:
+            raise ValueError("a path needs at least 2 waypoints")
+        self._waypoints: np.ndarray = waypoints
+        size = waypoints.shape[0]
+        self._segment_vectors: np.ndarray = np.zeros((size - 1, 2))
+        self._segment_lengths: np.ndarray = np.zeros(size - 1)
+        self._segment_directions: np.ndarray = np.zeros((size - 1, 2))
+        self._segment_headings: np.ndarray = np.zeros(size - 1)
+        self._arc_lengths: np.ndarray = np.zeros(size)
+        self._curvatures: np.ndarray = np.zeros(size)
+        self._check_segments(0, size - 2)
+        self._recompute(0, size - 1)
+
+    @classmethod
+    def from_vectors(cls, waypoints: typing.Sequence[k2d.Vector]) -> "Path":
+        return cls(np.array([[v.x, v.y] for v in waypoints]))
+
+    @classmethod
+    def from_copy(cls, source: "Path") -> "Path":
+        return cls(source._waypoints)
+
+    @property
+    def waypoints(self) -> np.ndarray:
+        return _read_only(self._waypoints)
+
+    @property
+    def arc_lengths(self) -> np.ndarray:
+        return _read_only(self._arc_lengths)
+
+    @property
+    def segment_lengths(self) -> np.ndarray:
+        return _read_only(self._segment_lengths)
+
+    @property
+    def segment_directions(self) -> np.ndarray:
+        return _read_only(self._segment_directions)
+
+    @property
+    def length(self) -> float:
+        return float(self._arc_lengths[-1])
+
+    def __repr__(self) -> str:
+        return "Path(waypoints: {}, length: {})".format(
+            len(self._waypoints), self.length
+        )
+
+    def __len__(self) -> int:
+        return len(self._waypoints)
+
+    def set_waypoints(self, indices: typing.Sequence[int], values: np.ndarray) -> None:
+        """Move some waypoints, recomputing only the geometry that depends on them."""
+        index_array = np.atleast_1d(np.asarray(indices, dtype=int))
+        if index_array.size == 0:
+            return
+        size = len(self._waypoints)
+        if np.any((index_array < -size) | (index_array >= size)):
+            raise IndexError("waypoint index out of range")
+        index_array = np.where(index_array < 0, index_array + size, index_array)
+        first, last = int(index_array.min()), int(index_array.max())
+        previous = self._waypoints[index_array].copy()
+        self._waypoints[index_array] = np.asarray(values, dtype=float).reshape(-1, 2)
+        try:
+            self._check_segments(
+                max(first - 1, 0), min(last, len(self._segment_lengths) - 1)
+            )
+        except ValueError:
+            self._waypoints[index_array] = previous
+            raise
+        self._recompute(first, last)
+
+    def set_waypoint(self, index: int, value: k2d.Vector) -> None:
+        self.set_waypoints([index], np.array([[value.x, value.y]]))
+
+    def _check_segments(self, first: int, last: int) -> None:
+        """Raise ValueError if any of segments first..last has zero length."""
+        starts = self._waypoints[first : last + 1]
+        ends = self._waypoints[first + 1 : last + 2]
+        if np.any(np.all(starts == ends, axis=1)):
+            raise ValueError("consecutive waypoints must not be equal")
+
+    def _recompute(self, first: int, last: int) -> None:
+        """Update the cached geometry after waypoints first..last changed."""
+        num_segments = len(self._segment_lengths)
+        seg_first = max(first - 1, 0)
+        seg_last = min(last, num_segments - 1)
+        segments = slice(seg_first, seg_last + 1)
+
+        vectors = self._waypoints[seg_first + 1 : seg_last + 2] - self._waypoints[
+            seg_first : seg_last + 1
+        ]
+        lengths = np.hypot(vectors[:, 0], vectors[:, 1])
+        self._segment_vectors[segments] = vectors
+        self._segment_lengths[segments] = lengths
+        self._segment_directions[segments] = vectors / lengths[:, np.newaxis]
+        self._segment_headings[segments] = np.arctan2(vectors[:, 1], vectors[:, 0])
+
+        # Arc lengths of every waypoint after the first changed segment shift.
+        self._arc_lengths[seg_first + 1 :] = self._arc_lengths[seg_first] + np.cumsum(
+            self._segment_lengths[seg_first:]
+        )
+
+        # Curvature of a vertex depends on its two neighbouring segments.
+        vertex_first = max(seg_first, 1)
+        vertex_last = min(seg_last + 1, num_segments - 1)
+        if vertex_first <= vertex_last:
+            vertices = slice(vertex_first, vertex_last + 1)
+            turns = self._wrap(
+                self._segment_headings[vertex_first : vertex_last + 1]
+                - self._segment_headings[vertex_first - 1 : vertex_last]
+            )
+            spans = 0.5 * (
+                self._segment_lengths[vertex_first - 1 : vertex_last]
+                + self._segment_lengths[vertex_first : vertex_last + 1]
+            )
+            self._curvatures[vertices] = turns / spans
+
+    @staticmethod
+    def _wrap(angles: np.ndarray) -> np.ndarray:
+        return (angles + k2d.PI) % (2.0 * k2d.PI) - k2d.PI
+
+    def _clamp(self, arc_lengths: _ArrayLike) -> np.ndarray:
+        return np.clip(np.asarray(arc_lengths, dtype=float), 0.0, self.length)
+
+    def _segment_at(self, arc_lengths: np.ndarray) -> np.ndarray:
+        indices = np.searchsorted(self._arc_lengths, arc_lengths, side="right") - 1
+        return np.clip(indices, 0, len(self._segment_lengths) - 1)
+
+    def project(
+        self, points: np.ndarray
+    ) -> typing.Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Find the closest point on the path to each of the M x 2 query points.
+
+        Returns the closest points (M x 2), their arc lengths (M), the signed
+        cross-track errors (M, positive to the left of the path) and the
+        indices of the segments they lie on (M).
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        starts = self._waypoints[:-1]
+        # M x S offsets of every query point from every segment start.
+        offsets = points[:, np.newaxis, :] - starts[np.newaxis, :, :]
+        t = np.einsum("msk,sk->ms", offsets, self._segment_vectors) / (
+            self._segment_lengths ** 2
+        )
+        t = np.clip(t, 0.0, 1.0)
+        closest = starts[np.newaxis, :, :] + t[:, :, np.newaxis] * self._segment_vectors
+        deltas = points[:, np.newaxis, :] - closest
+        distances = np.einsum("msk,msk->ms", deltas, deltas)
+
+        rows = np.arange(len(points))
+        segments = np.argmin(distances, axis=1)
+        closest_points = closest[rows, segments]
+        arc_lengths = (
+            self._arc_lengths[segments]
+            + t[rows, segments] * self._segment_lengths[segments]
+        )
+        directions = self._segment_directions[segments]
+        deltas = deltas[rows, segments]
+        cross = directions[:, 0] * deltas[:, 1] - directions[:, 1] * deltas[:, 0]
+        errors = np.sqrt(distances[rows, segments])
+        cross_track_errors = np.where(cross < 0.0, -errors, errors)
+        return closest_points, arc_lengths, cross_track_errors, segments
+
+    def point_at(self, arc_lengths: _ArrayLike) -> np.ndarray:
+        """Interpolate the points at the given arc lengths, clamped to the path."""
+        clamped = self._clamp(arc_lengths)
+        segments = self._segment_at(clamped)
+        along = clamped - self._arc_lengths[segments]
+        return (
+            self._waypoints[segments]
+            + along[..., np.newaxis] * self._segment_directions[segments]
+        )
+
+    def lookahead(self, points: np.ndarray, distance: float) -> np.ndarray:
+        """Find the points distance further along the path than each projection."""
+        _, arc_lengths, _, _ = self.project(points)
+        return self.point_at(arc_lengths + distance)
+
+    def heading_at(self, arc_lengths: _ArrayLike) -> np.ndarray:
+        """Sample the heading (in radians) of the segments at the given arc lengths."""
+        return self._segment_headings[self._segment_at(self._clamp(arc_lengths))]
+
+    def heading_error(self, points: np.ndarray, orientations: _ArrayLike) -> np.ndarray:
+        """Calculate the difference (in radians) of each orientation from the path."""
+        _, _, _, segments = self.project(points)
+        return self._wrap(
+            np.asarray(orientations, dtype=float) - self._segment_headings[segments]
+        )
+
+    def curvature_at(self, arc_lengths: _ArrayLike) -> np.ndarray:
+        """Sample the curvature, linearly interpolated between the waypoints."""
+        return np.interp(self._clamp(arc_lengths), self._arc_lengths, self._curvatures)
@@ -17,6 +17,7 @@ class Pose:
     def __init__(self, position: k2d.Vector, orientation: float) -> None:
         self._position: k2d.Vector = k2d.Vector.from_copy(position)
         self._orientation: float = orientation
+        self._version: int = 0
 
     @classmethod
     def from_copy(cls, source: "Pose") -> "Pose":
@@ -34,6 +35,7 @@ class Pose:
     def position(self, value: k2d.Vector) -> None:
         self._position.x = value.x
         self._position.y = value.y
+        self._version += 1
 
     @property
     def orientation(self) -> float:
@@ -42,6 +44,12 @@ class Pose:
     @orientation.setter
     def orientation(self, value: float) -> None:
         self._orientation = value
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        """Counter that increases every time the pose is mutated."""
+        return self._version + self._position.version
 
     def __repr__(self) -> str:
         return "Pose(pos: {}, ort: {})".format(self.position, self.orientation)
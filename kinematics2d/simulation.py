@@ -0,0 +1,219 @@
+import asyncio
+import time
+import typing
+
+import kinematics2d as k2d
+
+__all__ = ["Simulator", "SimulatorStats"]
+
+
+class SimulatorStats:
+    """Timing metrics of a simulator.
+
+    Attributes:
+        - ticks: int (number of steps executed)
+        - simulated_steps: int (number of time steps covered by the ticks)
+        - overruns: int (number of ticks that had to catch up missed time steps)
+        - missed_steps: int (number of time steps batched into a later tick)
+        - dropped_steps: int (number of time steps skipped by the catch-up limit)
+        - max_lag: float (largest lateness of a tick, in seconds)
+        - last_step_duration: float (wall time of the last step, in seconds)
+    """
+
+    def __init__(self) -> None:
+        self.ticks: int = 0
+        self.simulated_steps: int = 0
+        self.overruns: int = 0
+        self.missed_steps: int = 0
+        self.dropped_steps: int = 0
+        self.max_lag: float = 0.0
+        self.last_step_duration: float = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            "SimulatorStats(ticks: {}, steps: {}, overruns: {}, missed: {}, "
+            "dropped: {}, max_lag: {})"
+        ).format(
+            self.ticks,
+            self.simulated_steps,
+            self.overruns,
+            self.missed_steps,
+            self.dropped_steps,
+            self.max_lag,
+        )
+
+
+class Simulator:
+    """An asyncio fixed-rate simulator of a set of kinematics.
+
+    Every tick advances each body with Kinematics.updated. Ticks are scheduled
+    against absolute deadlines of a monotonic clock, so sleep jitter does not
+    accumulate into drift. A late tick batches the missed time steps into one
+    step with a larger delta time, up to max_catch_up_steps time steps.
+
+    Updates from other coroutines are staged with set and remove and are
+    applied together right before the next step.
+    """
+
+    def __init__(
+        self,
+        time_step: float,
+        bodies: typing.Optional[typing.Mapping[typing.Hashable, k2d.Kinematics]] = None,
+        max_catch_up_steps: int = 10,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ) -> None:
+        if time_step <= 0.0:
+            raise ValueError("time_step must be positive")
+        if max_catch_up_steps < 1:
+            raise ValueError("max_catch_up_steps must be at least 1")
+        self._time_step: float = time_step
+        self._max_catch_up_steps: int = max_catch_up_steps
+        self._clock: typing.Callable[[], float] = clock
+        self._bodies: typing.Dict[typing.Hashable, k2d.Kinematics] = {}
+        if bodies is not None:
+            for key, body in bodies.items():
+                self._bodies[key] = k2d.Kinematics.from_copy(body)
+        self._pending: typing.Dict[
+            typing.Hashable, typing.Optional[k2d.Kinematics]
+        ] = {}
+        self._waiters: typing.List[asyncio.Future] = []
+        self._time: float = 0.0
+        self._running: bool = False
+        self._stop_requested: bool = False
+        self._wakeup: typing.Optional[asyncio.Future] = None
+        self.stats: SimulatorStats = SimulatorStats()
+
+    @property
+    def time_step(self) -> float:
+        return self._time_step
+
+    @property
+    def time(self) -> float:
+        """Simulated time (in seconds) elapsed since the simulator was created."""
+        return self._time
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    def __repr__(self) -> str:
+        return "Simulator(dt: {}, time: {}, bodies: {})".format(
+            self._time_step, self._time, len(self._bodies)
+        )
+
+    def __len__(self) -> int:
+        return len(self._bodies)
+
+    def __getitem__(self, key: typing.Hashable) -> k2d.Kinematics:
+        """Copy the state of key as of the last step."""
+        return k2d.Kinematics.from_copy(self._bodies[key])
+
+    def __contains__(self, key: typing.Hashable) -> bool:
+        return key in self._bodies
+
+    def set(self, key: typing.Hashable, kinematics: k2d.Kinematics) -> None:
+        """Stage a body to be added or replaced before the next step."""
+        self._pending[key] = k2d.Kinematics.from_copy(kinematics)
+
+    def remove(self, key: typing.Hashable) -> None:
+        """Stage a body to be removed before the next step."""
+        self._pending[key] = None
+
+    def snapshot(self) -> typing.Dict[typing.Hashable, k2d.Kinematics]:
+        """Copy the state of every body as of the last step."""
+        return {
+            key: k2d.Kinematics.from_copy(body) for key, body in self._bodies.items()
+        }
+
+    async def next_snapshot(self) -> typing.Dict[typing.Hashable, k2d.Kinematics]:
+        """Wait for the next step and return a snapshot of its result.
+
+        Waiting may start before run does. Raises RuntimeError if stop is
+        called, or run returns, before the next step.
+        """
+        waiter = asyncio.get_event_loop().create_future()
+        self._waiters.append(waiter)
+        return await waiter
+
+    def step(self, delta_time: typing.Optional[float] = None) -> None:
+        """Apply the staged updates, then advance every body by delta_time."""
+        if delta_time is None:
+            delta_time = self._time_step
+        pending, self._pending = self._pending, {}
+        for key, body in pending.items():
+            if body is None:
+                self._bodies.pop(key, None)
+            else:
+                self._bodies[key] = body
+        for key, body in self._bodies.items():
+            self._bodies[key] = body.updated(delta_time)
+        self._time += delta_time
+
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(self.snapshot())
+
+    async def run(self, max_ticks: typing.Optional[int] = None) -> None:
+        """Step at the fixed rate until stop is called or max_ticks is reached."""
+        if self._running:
+            raise RuntimeError("simulator is already running")
+        self._running = True
+        deadline = self._clock() + self._time_step
+        ticks = 0
+        try:
+            while not self._stop_requested and (
+                max_ticks is None or ticks < max_ticks
+            ):
+                now = self._clock()
+                if now < deadline:
+                    # Sleep until the deadline, or until stop resolves the wakeup.
+                    self._wakeup = asyncio.get_event_loop().create_future()
+                    await asyncio.wait([self._wakeup], timeout=deadline - now)
+                    self._wakeup = None
+                    now = self._clock()
+                    if self._stop_requested:
+                        break
+
+                lag = max(now - deadline, 0.0)
+                missed = int((lag + k2d.EPSILON) // self._time_step)
+                steps = 1 + missed
+                dropped = max(steps - self._max_catch_up_steps, 0)
+                steps -= dropped
+
+                start = self._clock()
+                self.step(steps * self._time_step)
+                self.stats.last_step_duration = self._clock() - start
+
+                self.stats.ticks += 1
+                self.stats.simulated_steps += steps
+                self.stats.max_lag = max(self.stats.max_lag, lag)
+                if missed > 0:
+                    self.stats.overruns += 1
+                    self.stats.missed_steps += missed - dropped
+                    self.stats.dropped_steps += dropped
+
+                deadline += (1 + missed) * self._time_step
+                ticks += 1
+        finally:
+            self._running = False
+            self._stop_requested = False
+            self._wakeup = None
+            self._fail_waiters()
+
+    def stop(self) -> None:
+        """Make run return, even if its task has not started yet.
+
+        Pending next_snapshot calls fail right away. A stop requested while
+        run is not executing is kept until the next run returns.
+        """
+        self._stop_requested = True
+        if self._wakeup is not None and not self._wakeup.done():
+            self._wakeup.set_result(None)
+        self._fail_waiters()
+
+    def _fail_waiters(self) -> None:
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_exception(RuntimeError("simulator stopped"))
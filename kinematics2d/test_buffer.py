@@ -0,0 +1,66 @@
+import threading
+
+import numpy as np
+import pytest
+
+import kinematics2d as k2d
+
+
+class TestKinematicsBuffer:
+    def test_init(self) -> None:
+        k = k2d.Kinematics(k2d.Vector(1.0, 2.0), 0.5, k2d.Vector(3.0, 4.0), 0.1)
+        buf = k2d.KinematicsBuffer(["a", "b"], {"a": k})
+        assert buf.sequence == 0 and len(buf) == 2
+        assert buf.frame["a"].position.is_close_to(k2d.Vector(1.0, 2.0))
+        assert buf.frame["b"].velocity.is_close_to(k2d.Vector.zeros())
+
+        with pytest.raises(ValueError):
+            k2d.KinematicsBuffer(["a", "a"])
+
+    def test_set_is_staged(self) -> None:
+        buf = k2d.KinematicsBuffer(["a"])
+        k = k2d.Kinematics(k2d.Vector(1.0, 2.0), 0.5, k2d.Vector(3.0, 4.0), 0.1)
+        buf.set("a", k)
+        assert buf.frame["a"].position.is_close_to(k2d.Vector.zeros())
+
+        frame = buf.publish()
+        assert frame is buf.frame and frame.sequence == 1
+        a = frame["a"]
+        assert a.position.is_close_to(k2d.Vector(1.0, 2.0))
+        assert k2d.is_close(a.orientation, 0.5)
+        assert a.velocity.is_close_to(k2d.Vector(3.0, 4.0))
+        assert k2d.is_close(a.rotation, 0.1)
+
+    def test_frame_is_immutable(self) -> None:
+        buf = k2d.KinematicsBuffer(["a"])
+        old = buf.frame
+        k = k2d.Kinematics(k2d.Vector(1.0, 2.0), 0.5, k2d.Vector(3.0, 4.0), 0.1)
+        buf.publish({"a": k})
+        assert old["a"].position.is_close_to(k2d.Vector.zeros())
+        with pytest.raises(ValueError):
+            buf.frame.positions[0, 0] = 42.0
+
+        k = buf.frame["a"]
+        k.position.x = 42.0
+        assert buf.frame.positions[0, 0] == 1.0
+
+    def test_concurrent_readers(self) -> None:
+        buf = k2d.KinematicsBuffer(["a"])
+        torn = []
+
+        def read() -> None:
+            for _ in range(2000):
+                position = buf.frame.positions[0]
+                if position[0] != position[1]:
+                    torn.append(position)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        for i in range(2000):
+            k = k2d.Kinematics(k2d.Vector(i, i), 0.0, k2d.Vector.zeros(), 0.0)
+            buf.publish({"a": k})
+        for reader in readers:
+            reader.join()
+        assert not torn
+        assert np.array_equal(buf.frame.positions[0], [1999.0, 1999.0])
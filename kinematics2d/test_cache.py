@@ -0,0 +1,70 @@
+import pytest
+
+import kinematics2d as k2d
+
+
+class TestRelativeFrameCache:
+    def test_init_invalid(self) -> None:
+        with pytest.raises(ValueError):
+            k2d.RelativeFrameCache(0)
+
+    def test_relative_pose(self) -> None:
+        cache = k2d.RelativeFrameCache()
+        target = k2d.Pose(k2d.Vector(2.2, 3.3), k2d.PI)
+        robot = k2d.Pose(k2d.Vector(1.1, 1.1), k2d.PI / 2)
+
+        p1 = cache.relative_pose(target, robot)
+        p2 = cache.relative_pose(target, robot)
+        assert p1 is p2 and p1.is_at(target - robot)
+        assert cache.hits == 1 and cache.misses == 1
+        assert k2d.is_close(cache.hit_rate, 0.5)
+
+    def test_relative_kinematics(self) -> None:
+        cache = k2d.RelativeFrameCache()
+        target = k2d.Kinematics(k2d.Vector(2, 3), 1.0, k2d.Vector(1, 0), 0.5)
+        robot = k2d.Kinematics(k2d.Vector(1, 1), 0.5, k2d.Vector(0, 1), 0.1)
+
+        k1 = cache.relative_kinematics(target, robot)
+        k2 = cache.relative_kinematics(target, robot)
+        expected = target - robot
+        assert k1 is k2
+        assert k1.pose.is_at(expected.pose)
+        assert k1.velocity.is_close_to(expected.velocity)
+
+    def test_invalidate_on_mutation(self) -> None:
+        cache = k2d.RelativeFrameCache()
+        target = k2d.Kinematics(k2d.Vector(2, 3), 1.0, k2d.Vector(1, 0), 0.5)
+        robot = k2d.Kinematics.zeros()
+
+        cache.relative_kinematics(target, robot)
+        robot.position = k2d.Vector(1, 1)
+        k = cache.relative_kinematics(target, robot)
+        assert k.pose.is_at((target - robot).pose)
+        target.velocity.x = 4
+        k = cache.relative_kinematics(target, robot)
+        assert k.velocity.is_close_to((target - robot).velocity)
+        assert cache.hits == 0 and cache.misses == 3
+
+        k.rotation = 42.0
+        assert k2d.is_close(cache.relative_kinematics(target, robot).rotation, 0.5)
+        assert cache.misses == 4
+        assert len(cache) == 1
+
+    def test_lru_eviction(self) -> None:
+        cache = k2d.RelativeFrameCache(max_size=2)
+        robot = k2d.Pose.zeros()
+        targets = [k2d.Pose(k2d.Vector(i, 0), 0.0) for i in range(3)]
+
+        cache.relative(targets[0], robot)
+        cache.relative(targets[1], robot)
+        cache.relative(targets[0], robot)
+        cache.relative(targets[2], robot)
+        assert len(cache) == 2
+
+        cache.relative(targets[0], robot)
+        assert cache.hits == 2
+        cache.relative(targets[1], robot)
+        assert cache.misses == 4
+
+        cache.clear()
+        assert len(cache) == 0
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+import kinematics2d as k2d
+
+
+def mean_kinematics() -> k2d.Kinematics:
+    return k2d.Kinematics(k2d.Vector(1.0, 2.0), 0.5, k2d.Vector(2.0, 1.0), 0.8)
+
+
+class TestParticleSet:
+    def test_sample(self) -> None:
+        k = mean_kinematics()
+        p1 = k2d.ParticleSet.sample(k, 100, np.eye(2) * 0.1, 0.01, seed=42)
+        p2 = k2d.ParticleSet.sample(k, 100, np.eye(2) * 0.1, 0.01, seed=42)
+        assert len(p1) == 100
+        assert np.array_equal(p1.velocities, p2.velocities)
+        assert np.array_equal(p1.rotations, p2.rotations)
+        assert np.allclose(p1.positions, [1.0, 2.0])
+        assert np.allclose(p1.orientations, 0.5)
+
+        with pytest.raises(ValueError):
+            k2d.ParticleSet.sample(k, 0)
+        with pytest.raises(ValueError):
+            k2d.ParticleSet.sample(k, 10, rotation_variance=-0.1)
+        with pytest.raises(ValueError):
+            k2d.ParticleSet.sample(k, 10, orientation_variance=-0.1)
+
+    def test_propagate_matches_updated(self) -> None:
+        k = mean_kinematics()
+        particles = k2d.ParticleSet.sample(k, 20, np.eye(2), 0.5, seed=1)
+        propagated = particles.propagated(0.5)
+        for i in range(len(particles)):
+            expected = particles[i].updated(0.5)
+            actual = propagated[i]
+            assert actual.pose.is_at(expected.pose)
+            assert actual.velocity.is_close_to(expected.velocity)
+
+    def test_mean_pose(self) -> None:
+        particles = k2d.ParticleSet(
+            [[0.0, 0.0], [2.0, 2.0]],
+            [k2d.PI - 0.1, -k2d.PI + 0.1],
+            np.zeros((2, 2)),
+            np.zeros(2),
+        )
+        pose = particles.mean_pose()
+        assert pose.position.is_close_to(k2d.Vector(1.0, 1.0))
+        assert pose.is_at_orientation(k2d.PI)
+
+        covariance = particles.covariance()
+        assert covariance.shape == (3, 3)
+        assert k2d.is_close(covariance[2, 2], 0.02)
+
+    def test_covariance(self) -> None:
+        k = k2d.Kinematics.zeros()
+        velocity_covariance = np.array([[0.4, 0.1], [0.1, 0.2]])
+        particles = k2d.ParticleSet.sample(k, 20000, velocity_covariance, seed=7)
+        particles.propagate(0.5)
+        covariance = particles.covariance()
+        assert np.allclose(covariance[:2, :2], velocity_covariance * 0.25, atol=0.005)
+
+    def test_histogram(self) -> None:
+        particles = k2d.ParticleSet(
+            [[0.5, 0.5], [0.5, 0.5], [1.5, 0.5], [1.5, 1.5]],
+            np.zeros(4),
+            np.zeros((4, 2)),
+            np.zeros(4),
+        )
+        grid, x_edges, y_edges = particles.histogram(2, [[0.0, 2.0], [0.0, 2.0]])
+        assert np.allclose(grid, [[0.5, 0.0], [0.25, 0.25]])
+        assert np.allclose(x_edges, [0.0, 1.0, 2.0])
+        grid, _, _ = particles.histogram(2, [[0.0, 2.0], [0.0, 2.0]], normalized=False)
+        assert grid.sum() == 4
+        grid, _, _ = particles.histogram(1, bounds=[[0.0, 1.0], [0.0, 1.0]])
+        assert np.allclose(grid, [[0.5]])
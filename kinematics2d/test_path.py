@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+import kinematics2d as k2d
+
+
+def l_path() -> k2d.Path:
+    return k2d.Path(np.array([[0.0, 0.0], [2.0, 0.0], [2.0, 2.0]]))
+
+
+class TestPath:
+    def test_init(self) -> None:
+        p = l_path()
+        assert len(p) == 3 and k2d.is_close(p.length, 4.0)
+        assert np.allclose(p.arc_lengths, [0.0, 2.0, 4.0])
+        assert np.allclose(p.segment_directions, [[1.0, 0.0], [0.0, 1.0]])
+
+        with pytest.raises(ValueError):
+            k2d.Path(np.array([[0.0, 0.0]]))
+        with pytest.raises(ValueError):
+            k2d.Path(np.zeros((3, 3)))
+        with pytest.raises(ValueError):
+            k2d.Path(np.array([[0.0, 0.0], [1.0, 0.0], [1.0, 0.0], [1.0, 1.0]]))
+
+    def test_init_from_vectors(self) -> None:
+        p = k2d.Path.from_vectors([k2d.Vector(0, 0), k2d.Vector(3, 4)])
+        assert k2d.is_close(p.length, 5.0)
+
+    def test_read_only(self) -> None:
+        p = l_path()
+        with pytest.raises(ValueError):
+            p.waypoints[0, 0] = 1.0
+
+    def test_project(self) -> None:
+        p = l_path()
+        points, arc_lengths, errors, segments = p.project(
+            np.array([[1.0, 0.5], [1.0, -0.5], [3.0, 1.5], [-1.0, 0.0]])
+        )
+        assert np.allclose(points, [[1.0, 0.0], [1.0, 0.0], [2.0, 1.5], [0.0, 0.0]])
+        assert np.allclose(arc_lengths, [1.0, 1.0, 3.5, 0.0])
+        assert np.allclose(errors, [0.5, -0.5, -1.0, 1.0])
+        assert np.array_equal(segments, [0, 0, 1, 0])
+
+        v = k2d.Vector(1.0, 0.5)
+        segment = k2d.Vector(2.0, 0.0)
+        assert k2d.Vector.from_ndarray(points[0]).is_close_to(v.projected_to(segment))
+
+    def test_point_at(self) -> None:
+        p = l_path()
+        assert np.allclose(
+            p.point_at([-1.0, 1.0, 2.0, 3.0, 5.0]),
+            [[0.0, 0.0], [1.0, 0.0], [2.0, 0.0], [2.0, 1.0], [2.0, 2.0]],
+        )
+
+    def test_lookahead(self) -> None:
+        p = l_path()
+        assert np.allclose(p.lookahead(np.array([[1.0, 0.5]]), 1.5), [[2.0, 0.5]])
+
+    def test_heading(self) -> None:
+        p = l_path()
+        assert np.allclose(p.heading_at([0.5, 3.0]), [0.0, k2d.PI / 2])
+        errors = p.heading_error(np.array([[1.0, 0.1], [2.1, 1.0]]), [0.1, 0.0])
+        assert np.allclose(errors, [0.1, -k2d.PI / 2])
+
+    def test_curvature(self) -> None:
+        p = l_path()
+        assert np.allclose(
+            p.curvature_at([0.0, 1.0, 2.0, 4.0]), [0.0, k2d.PI / 8, k2d.PI / 4, 0.0]
+        )
+
+    def test_set_waypoints(self) -> None:
+        p = k2d.Path(np.array([[0.0, 0.0], [1.0, 0.0], [2.0, 0.0], [3.0, 0.0]]))
+        p.set_waypoint(2, k2d.Vector(2.0, 1.0))
+        q = k2d.Path(np.array([[0.0, 0.0], [1.0, 0.0], [2.0, 1.0], [3.0, 0.0]]))
+        assert np.allclose(p.arc_lengths, q.arc_lengths)
+        assert np.allclose(p.segment_directions, q.segment_directions)
+        s = q.arc_lengths
+        assert np.allclose(p.curvature_at(s), q.curvature_at(s))
+
+        p.set_waypoints([0, -1], np.array([[0.0, 1.0], [3.0, 1.0]]))
+        q = k2d.Path(np.array([[0.0, 1.0], [1.0, 0.0], [2.0, 1.0], [3.0, 1.0]]))
+        assert np.allclose(p.arc_lengths, q.arc_lengths)
+        s = q.arc_lengths
+        assert np.allclose(p.curvature_at(s), q.curvature_at(s))
+
+        with pytest.raises(ValueError):
+            p.set_waypoint(1, k2d.Vector(2.0, 1.0))
+        assert np.allclose(p.waypoints, q.waypoints)
+
+        with pytest.raises(IndexError):
+            p.set_waypoint(4, k2d.Vector(5.0, 5.0))
+        with pytest.raises(IndexError):
+            p.set_waypoints([1, -5], np.array([[5.0, 5.0], [6.0, 6.0]]))
+        assert np.allclose(p.waypoints, q.waypoints)
@@ -37,6 +37,20 @@ class TestPose:
         assert p.position.y == 21
         assert p.orientation == 0.6
 
+    def test_version(self) -> None:
+        p = k2d.Pose(k2d.Vector(24, 42), 1.2)
+        version = p.version
+        p.orientation = 0.6
+        assert p.version > version
+
+        version = p.version
+        p.position = k2d.Vector(12, 21)
+        assert p.version > version
+
+        version = p.version
+        p.position.x = 6
+        assert p.version > version
+
     def test_repr(self) -> None:
         p = k2d.Pose(k2d.Vector(24.42, 42.24), 1.221)
         p_repr = "Pose(pos: {}, ort: 1.221)".format(str(p.position))
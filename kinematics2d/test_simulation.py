@@ -0,0 +1,124 @@
+import asyncio
+import typing
+
+import pytest
+
+import kinematics2d as k2d
+
+T = typing.TypeVar("T")
+
+
+class FakeClock:
+    def __init__(self, times: typing.Sequence[float]) -> None:
+        self.times: typing.List[float] = list(times)
+
+    def __call__(self) -> float:
+        if len(self.times) > 1:
+            return self.times.pop(0)
+        return self.times[0]
+
+
+def run(coroutine: typing.Awaitable[T]) -> T:
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class TestSimulator:
+    def test_init_invalid(self) -> None:
+        with pytest.raises(ValueError):
+            k2d.Simulator(0.0)
+        with pytest.raises(ValueError):
+            k2d.Simulator(0.1, max_catch_up_steps=0)
+
+    def test_step(self) -> None:
+        k = k2d.Kinematics(k2d.Vector(1.0, 2.0), 0.0, k2d.Vector(2.0, 0.0), 0.0)
+        sim = k2d.Simulator(0.5, {"a": k})
+        sim.step()
+        assert sim["a"].position.is_close_to(k2d.Vector(2.0, 2.0))
+        assert k.position.is_close_to(k2d.Vector(1.0, 2.0))
+        assert k2d.is_close(sim.time, 0.5)
+
+    def test_staged_updates(self) -> None:
+        sim = k2d.Simulator(1.0, {"a": k2d.Kinematics.zeros()})
+        moving = k2d.Kinematics(k2d.Vector(0.0, 0.0), 0.0, k2d.Vector(1.0, 1.0), 0.0)
+        sim.set("b", moving)
+        sim.remove("a")
+        assert "a" in sim and "b" not in sim
+
+        sim.step()
+        assert "a" not in sim and "b" in sim
+        assert sim["b"].position.is_close_to(k2d.Vector(1.0, 1.0))
+
+    def test_snapshot_is_copy(self) -> None:
+        sim = k2d.Simulator(1.0, {"a": k2d.Kinematics.zeros()})
+        snapshot = sim.snapshot()
+        snapshot["a"].position.x = 42.0
+        sim["a"].position.x = 42.0
+        assert sim["a"].position.x == 0.0
+
+    def test_next_snapshot(self) -> None:
+        k = k2d.Kinematics(k2d.Vector(0.0, 0.0), 0.0, k2d.Vector(1.0, 0.0), 0.0)
+        sim = k2d.Simulator(0.01, {"a": k})
+
+        async def main() -> typing.Dict[typing.Hashable, k2d.Kinematics]:
+            task = asyncio.ensure_future(sim.run())
+            snapshot = await sim.next_snapshot()
+            sim.stop()
+            await task
+            return snapshot
+
+        snapshot = run(main())
+        assert snapshot["a"].position.x > 0.0
+        assert sim.stats.ticks >= 1 and not sim.is_running
+
+    def test_next_snapshot_stopped_before_run(self) -> None:
+        sim = k2d.Simulator(0.01, {"a": k2d.Kinematics.zeros()})
+
+        async def main() -> None:
+            asyncio.get_event_loop().call_soon(sim.stop)
+            await sim.next_snapshot()
+
+        with pytest.raises(RuntimeError):
+            run(main())
+
+    def test_stop_before_run_starts(self) -> None:
+        sim = k2d.Simulator(0.01, {"a": k2d.Kinematics.zeros()})
+
+        async def main() -> None:
+            task = asyncio.ensure_future(sim.run())
+            sim.stop()
+            await asyncio.wait_for(task, timeout=1.0)
+
+        run(main())
+        assert sim.stats.ticks == 0 and not sim.is_running
+
+    def test_next_snapshot_stopped(self) -> None:
+        sim = k2d.Simulator(10.0, {"a": k2d.Kinematics.zeros()})
+
+        async def main() -> None:
+            task = asyncio.ensure_future(sim.run())
+            asyncio.get_event_loop().call_soon(sim.stop)
+            try:
+                await sim.next_snapshot()
+            finally:
+                await task
+
+        with pytest.raises(RuntimeError):
+            run(main())
+        assert sim.stats.ticks == 0
+
+    def test_run_catch_up(self) -> None:
+        clock = FakeClock([0.0, 0.35, 0.35, 0.35, 1.0])
+        k = k2d.Kinematics(k2d.Vector(0.0, 0.0), 0.0, k2d.Vector(1.0, 0.0), 0.0)
+        sim = k2d.Simulator(0.1, {"a": k}, max_catch_up_steps=3, clock=clock)
+        run(sim.run(max_ticks=2))
+        assert sim.stats.ticks == 2
+        assert sim.stats.overruns == 2
+        assert sim.stats.simulated_steps == 6
+        assert sim.stats.missed_steps == 4
+        assert sim.stats.dropped_steps == 4
+        assert k2d.is_close(sim.stats.max_lag, 0.6)
+        assert k2d.is_close(sim["a"].position.x, 0.6)
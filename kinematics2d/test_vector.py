@@ -36,6 +36,13 @@ class TestVector:
         assert v.x == 12
         assert v.y == 21
 
+    def test_version(self) -> None:
+        v = k2d.Vector(24, 42)
+        assert v.version == 0
+        v.x = 12
+        v.y = 21
+        assert v.version == 2
+
     def test_repr(self) -> None:
         v = k2d.Vector(24.42, 42.24)
         v_repr = "Vector(x: 24.42, y: 42.24)"
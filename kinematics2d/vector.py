@@ -18,6 +18,7 @@ class Vector:
 
     def __init__(self, x: float, y: float) -> None:
         self._ndarray: np.ndarray = np.array([x, y]).astype(float)
+        self._version: int = 0
 
     @classmethod
     def from_copy(cls, source: "Vector") -> "Vector":
@@ -38,6 +39,7 @@ class Vector:
     @x.setter
     def x(self, value: float) -> None:
         self._ndarray[0] = value
+        self._version += 1
 
     @property
     def y(self) -> float:
@@ -46,6 +48,12 @@ class Vector:
     @y.setter
     def y(self, value: float) -> None:
         self._ndarray[1] = value
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        """Counter that increases every time the vector is mutated."""
+        return self._version
 
     def __repr__(self) -> str:
         return "Vector(x: {}, y: {})".format(self._ndarray[0], self._ndarray[1])
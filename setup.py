@@ -11,6 +11,6 @@ setuptools.setup(
     package_data={"kinematics2d": ["py.typed"]},
     packages=setuptools.find_packages(),
     python_requires=">=3.6",
-    install_requires=["numpy"],
+    install_requires=["numpy>=1.17"],
 )
 